@@ -1,6 +1,6 @@
+from collections import Counter
 from dataclasses import dataclass
 from enum import IntEnum
-from itertools import groupby
 from pathlib import Path
 from sys import stderr
 from typing import Iterable, TextIO, Final
@@ -27,7 +27,7 @@ class _Lado(IntEnum):
     D = 1
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, order=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class _Chinelo:
     """
     Modelo com estatísticas de um chinelo após leitura de arquivo de input.
@@ -40,17 +40,18 @@ class _Chinelo:
         return f'{self.id_modelo} {self.lado.name} {self.num_repeticoes}'
 
 
-def _buscar_estatisticas_chinelisticas(pares: Iterable[tuple[int, int]]) -> list[_Chinelo]:
+def _buscar_estatisticas_chinelisticas(ids_esquerda: Iterable[int], ids_direita: Iterable[int]) -> list[_Chinelo]:
     """
     Gera estatísticas para cada combinação de modelo e pé informados.
-    :param pares: Os pares de modelos de chinelo. Primeiro o pé esquerdo e depois, o direito.
+    :param ids_esquerda: Os modelos de chinelo do pé esquerdo.
+    :param ids_direita: Os modelos de chinelo do pé direito, na mesma ordem dos pares do pé esquerdo.
     :return: Lista com estatísticas para cada combinação de modelo e pé de chinelo.
     """
     return sorted(
         (_Chinelo(lado=_Lado(index_lado), id_modelo=id_modelo, num_repeticoes=num_repeticoes)
-         for index_lado, ids_modelo in enumerate(zip(*pares))
-         for id_modelo, instancias_id_modelo in groupby(sorted(ids_modelo))
-         if (num_repeticoes := len(tuple(instancias_id_modelo)) - 1)),
+         for index_lado, ids_modelo in enumerate((ids_esquerda, ids_direita))
+         for id_modelo, num_instancias in Counter(ids_modelo).items()
+         if (num_repeticoes := num_instancias - 1)),
         key=lambda chinelo: (chinelo.id_modelo, chinelo.lado)
     )
 
@@ -60,12 +61,9 @@ def _exec_caso_de_teste(arquivo_input: TextIO) -> None:
     Lê dados do arquivo de teste e exibe estatísticas no console.
     :param arquivo_input: Arquivo de teste para leitura.
     """
-    num_linhas = int(arquivo_input.readline())
-    linhas = [
-        (int(chinelo_esq), int(chinelo_dir))
-        for chinelo_esq, chinelo_dir in (arquivo_input.readline().split() for _ in range(num_linhas))
-    ]
-    chinelos = _buscar_estatisticas_chinelisticas(linhas)
+    num_linhas, *ids_modelo = map(int, arquivo_input.read().split())
+    ids_modelo = ids_modelo[:2 * num_linhas]
+    chinelos = _buscar_estatisticas_chinelisticas(ids_modelo[0::2], ids_modelo[1::2])
 
     if not len(chinelos):
         print(_MSG_SEM_TROCAS)
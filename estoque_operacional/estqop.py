@@ -1,9 +1,10 @@
+import csv
+import gc
 from dataclasses import dataclass
 from enum import IntEnum
-from itertools import groupby, chain
 from pathlib import Path
 from sys import stderr
-from typing import Final, Iterable, Self, ClassVar, Sequence
+from typing import Final, Iterable, Self, ClassVar, Sequence, TextIO, Iterator
 
 _MSG_INICIO: Final[str] = '''Estoque Operacional
 Abner Eduardo Ramos Ferreira
@@ -49,23 +50,25 @@ class _SituacaoVenda(IntEnum):
         Verifica se a situação de venda pode ser considerada como confirmada.
         :return: `True`, caso a situação de venda seja confirmada; caso contrário, `False`.
         """
-        return self in (self.CONFIRMADA_PGTO_OK, self.CONFIRMADA_PGTO_PENDENTE)
+        return self in _SITUACOES_VENDA_CONFIRMADAS
 
     def msg_erro(self) -> str:
         """
         Retorna a mensagem de erro associada à situação de venda, ou "N/A" em caso de sucesso.
         :return: Mensagem de erro associada à situação de venda, ou "N/A" em caso de sucesso.
         """
-        match self:
-            case self.CANCELADA:
-                return 'Venda cancelada'
-            case self.NAO_FINALIZADA:
-                return 'Venda não finalizada'
-            case self.ERRO_NAO_IDENTIFICADO:
-                # IMPORTANTE: O documento pede ponto final apesar dos arquivos de teste não seguirem isso.
-                return 'Erro desconhecido. Acionar equipe de TI.'
-            case _:
-                return 'N/A'
+        return _MSGS_ERRO_SITUACAO_VENDA.get(self, 'N/A')
+
+
+_SITUACOES_VENDA_CONFIRMADAS: Final[frozenset[_SituacaoVenda]] = frozenset((_SituacaoVenda.CONFIRMADA_PGTO_OK,
+                                                                            _SituacaoVenda.CONFIRMADA_PGTO_PENDENTE))
+
+_MSGS_ERRO_SITUACAO_VENDA: Final[dict[_SituacaoVenda, str]] = {
+    _SituacaoVenda.CANCELADA: 'Venda cancelada',
+    _SituacaoVenda.NAO_FINALIZADA: 'Venda não finalizada',
+    # IMPORTANTE: O documento pede ponto final apesar dos arquivos de teste não seguirem isso.
+    _SituacaoVenda.ERRO_NAO_IDENTIFICADO: 'Erro desconhecido. Acionar equipe de TI.',
+}
 
 
 class _CanalVenda(IntEnum):
@@ -82,15 +85,15 @@ class _CanalVenda(IntEnum):
         Retorna a descrição de um canal de venda, utilizada na relação gerada em um arquivo de saída.
         :return: Descrição do canal de venda.
         """
-        match self:
-            case self.REPR_COMERCIAL:
-                return 'Representantes'
-            case self.WEBSITE:
-                return 'Website'
-            case self.APP_ANDROID:
-                return 'App móvel Android'
-            case self.APP_IOS:
-                return 'App móvel iPhone'
+        return _DESCRICOES_CANAL_VENDA[self]
+
+
+_DESCRICOES_CANAL_VENDA: Final[dict[_CanalVenda, str]] = {
+    _CanalVenda.REPR_COMERCIAL: 'Representantes',
+    _CanalVenda.WEBSITE: 'Website',
+    _CanalVenda.APP_ANDROID: 'App móvel Android',
+    _CanalVenda.APP_IOS: 'App móvel iPhone',
+}
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -104,16 +107,6 @@ class _Venda:
     canal: _CanalVenda
 
 
-@dataclass(frozen=True, kw_only=True, slots=True)
-class _VendasPorProduto:
-    """
-    Associação entre um produto e várias vendas.
-    """
-    index: int
-    produto: _Produto
-    vendas: Sequence[_Venda]
-
-
 @dataclass(frozen=True, kw_only=True, slots=True)
 class _NecessidadeTransferencia:
     """
@@ -132,34 +125,26 @@ class _NecessidadeTransferencia:
     qtd_transf_arm_co: int
 
     @classmethod
-    def multigerar(cls, produtos: Iterable[_Produto], vendas: Iterable[_Venda]) -> Iterable[Self]:
+    def multigerar(cls, produtos: Sequence[_Produto], vendas: Sequence[_Venda]) -> Iterable[Self]:
         """
         Gera uma relação de necessidades de transferência com base nos produtos e vendas informados.
         :param produtos: Lista de produtos vinda de um arquivo de entrada.
         :param vendas: Lista de vendas vinda de um arquivo de entrada.
         :return: Relação de necessidades de transferência de armazenamento de produtos.
         """
-        vendas_produtos_raw = sorted((_VendasPorProduto(index=i, produto=p, vendas=(v,))
-                                      for v in vendas
-                                      for i, p in enumerate(produtos)
-                                      if v.cod_produto == p.codigo and v.situacao.is_confirmada()),
-                                     key=lambda vp: vp.produto.codigo)
-        vendas_produtos_agrupados = (_VendasPorProduto(index=rvp.index,
-                                                       produto=rvp.produto,
-                                                       vendas=tuple(chain.from_iterable((vp.vendas for vp in vps))))
-                                     for rvp, vps in groupby(vendas_produtos_raw,
-                                                             key=lambda vp: _VendasPorProduto(index=vp.index,
-                                                                                              produto=vp.produto,
-                                                                                              vendas=())))
-        vendas_produtos_ordem_original = sorted(vendas_produtos_agrupados, key=lambda vp: vp.index)
-        return (_NecessidadeTransferencia(cod_produto=vp.produto.codigo,
-                                          qtd_produto_co=vp.produto.qtd_estoque,
-                                          qtd_min_produto_co=vp.produto.qtd_min_co,
-                                          qtd_vendas=(qtd_vendas := sum(v.qtd for v in vp.vendas)),
-                                          qtd_estoque_pos_vendas=(est_pos_venda := vp.produto.qtd_estoque - qtd_vendas),
-                                          qtd_necessidade=(ne := abs(max(vp.produto.qtd_min_co - est_pos_venda, 0))),
+        qtd_vendas_por_codigo: dict[int, int] = {}
+        for v in vendas:
+            if v.situacao.is_confirmada():
+                qtd_vendas_por_codigo[v.cod_produto] = qtd_vendas_por_codigo.get(v.cod_produto, 0) + v.qtd
+        return (_NecessidadeTransferencia(cod_produto=produto.codigo,
+                                          qtd_produto_co=produto.qtd_estoque,
+                                          qtd_min_produto_co=produto.qtd_min_co,
+                                          qtd_vendas=qtd_vendas,
+                                          qtd_estoque_pos_vendas=(est_pos_venda := produto.qtd_estoque - qtd_vendas),
+                                          qtd_necessidade=(ne := abs(max(produto.qtd_min_co - est_pos_venda, 0))),
                                           qtd_transf_arm_co=cls.__NE_ESP if cls.__NE_LO < ne < cls.__NE_HI else ne)
-                for vp in vendas_produtos_ordem_original)
+                for produto in produtos
+                if (qtd_vendas := qtd_vendas_por_codigo.get(produto.codigo)) is not None)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -173,11 +158,12 @@ class _Divergencia:
     msg_err: str
 
     @classmethod
-    def multigerar(cls, produtos: Iterable[_Produto], vendas: Iterable[_Venda]) -> Iterable[Self]:
+    def multigerar(cls, produtos: Sequence[_Produto], vendas: Sequence[_Venda]) -> Iterable[Self]:
+        codigos = frozenset(p.codigo for p in produtos)
         return (_Divergencia(num_linha_venda=i + 1,
                              msg_err=f'{cls.__MSG_SEM_COD} {v.cod_produto:05d}' if s_produto else v.situacao.msg_erro())
                 for i, v in enumerate(vendas)
-                if (s_produto := v.cod_produto not in (p.codigo for p in produtos)) or not v.situacao.is_confirmada())
+                if (s_produto := v.cod_produto not in codigos) or not v.situacao.is_confirmada())
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -195,11 +181,13 @@ class _QtdVendasPorCanal:
         :param vendas: Relação de vendas vinda de um arquivo de entrada.
         :return: Relação de quantidade de vendas por canal.
         """
-        return sorted((_QtdVendasPorCanal(canal=canal, qtd_vendas=sum(v.qtd for v in vendas))
-                       for canal, vendas in groupby(sorted((v for v in vendas if v.situacao.is_confirmada()),
-                                                           key=lambda v: v.canal),
-                                                    key=lambda v: v.canal)),
-                      key=lambda vpc: vpc.canal)
+        qtd_vendas_por_canal: dict[_CanalVenda, int] = {}
+        for v in vendas:
+            if v.situacao.is_confirmada():
+                qtd_vendas_por_canal[v.canal] = qtd_vendas_por_canal.get(v.canal, 0) + v.qtd
+        return [_QtdVendasPorCanal(canal=canal, qtd_vendas=qtd_vendas_por_canal[canal])
+                for canal in _CanalVenda
+                if canal in qtd_vendas_por_canal]
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -207,9 +195,9 @@ class _Resultado:
     """
     Utilizado para representar o resultado dos cálculos de dados sobre vendas e produtos vindos de arquivos de entrada.
     """
-    necessidades: Iterable[_NecessidadeTransferencia]
-    divergencias: Iterable[_Divergencia]
-    vendas_por_canal: Iterable[_QtdVendasPorCanal]
+    necessidades: Sequence[_NecessidadeTransferencia]
+    divergencias: Sequence[_Divergencia]
+    vendas_por_canal: Sequence[_QtdVendasPorCanal]
 
 
 def _garantir_arquivos_entrada() -> bool:
@@ -224,6 +212,15 @@ def _garantir_arquivos_entrada() -> bool:
     return success
 
 
+def _ler_registros(arquivo: TextIO) -> Iterator[tuple[int, ...]]:
+    """
+    Lê os registros numéricos de um arquivo de entrada, um por linha.
+    :param arquivo: Arquivo de entrada com valores separados pelo delimitador de dados.
+    :return: Valores numéricos de cada linha do arquivo, na ordem em que aparecem.
+    """
+    return (tuple(map(int, registro)) for registro in csv.reader(arquivo, delimiter=_DELIMITADOR_DADOS))
+
+
 def _gerar_resultado() -> _Resultado | None:
     """
     Gera resultados dos cálculos de informações sobre produtos e vendas caso seja possível encontrar os arquivos.
@@ -232,22 +229,25 @@ def _gerar_resultado() -> _Resultado | None:
     if not _garantir_arquivos_entrada():
         return None
 
-    with (_CAMINHO_ARQUIVO_PRODUTOS.open() as arq_produtos,
-          _CAMINHO_ARQUIVO_VENDAS.open() as arq_vendas):
-        produtos = tuple(_Produto(codigo=int(cod), qtd_estoque=int(qtd_est), qtd_min_co=int(qtd_min))
-                         for cod, qtd_est, qtd_min in
-                         (linha.split(_DELIMITADOR_DADOS) for linha in arq_produtos.readlines()))
-
-        vendas = tuple(_Venda(cod_produto=int(cod_prd),
-                              qtd=int(qtd),
-                              situacao=_SituacaoVenda(int(sit)),
-                              canal=_CanalVenda(int(can)))
-                       for cod_prd, qtd, sit, can in
-                       (linha.split(_DELIMITADOR_DADOS) for linha in arq_vendas.readlines()))
-
-        necessidades = _NecessidadeTransferencia.multigerar(produtos, vendas)
-        divergencias = _Divergencia.multigerar(produtos, vendas)
-        vendas_por_canal = _QtdVendasPorCanal.multigerar(vendas)
+    with (_CAMINHO_ARQUIVO_PRODUTOS.open(newline='') as arq_produtos,
+          _CAMINHO_ARQUIVO_VENDAS.open(newline='') as arq_vendas):
+        # Os registros lidos não formam ciclos, então a coleta cíclica só atrasaria a criação em massa.
+        gc.disable()
+        try:
+            produtos = tuple(_Produto(codigo=cod, qtd_estoque=qtd_est, qtd_min_co=qtd_min)
+                             for cod, qtd_est, qtd_min in _ler_registros(arq_produtos))
+
+            vendas = tuple(_Venda(cod_produto=cod_prd,
+                                  qtd=qtd,
+                                  situacao=_SituacaoVenda(sit),
+                                  canal=_CanalVenda(can))
+                           for cod_prd, qtd, sit, can in _ler_registros(arq_vendas))
+        finally:
+            gc.enable()
+
+        necessidades = tuple(_NecessidadeTransferencia.multigerar(produtos, vendas))
+        divergencias = tuple(_Divergencia.multigerar(produtos, vendas))
+        vendas_por_canal = tuple(_QtdVendasPorCanal.multigerar(vendas))
 
         return _Resultado(necessidades=necessidades, divergencias=divergencias, vendas_por_canal=vendas_por_canal)
 
@@ -260,15 +260,15 @@ def _salvar_necessidades(necessidades: Iterable[_NecessidadeTransferencia]) -> N
     with _CAMINHO_ARQUIVO_TRANSFERENCIAS.open('w') as arq_transf:
         arq_transf.write('Necessidade de Transferência Armazém para CO\n\n'
                          'Produto  QtCO  QtMin  QtVendas  Estq.após  Necess.  Transf. de\n'
-                         '                                   Vendas            Arm p/ CO\n')
-        for n in necessidades:
-            arq_transf.write(f'{n.cod_produto:<5} '
-                             f'{n.qtd_produto_co:>7} '
-                             f'{n.qtd_min_produto_co:>6} '
-                             f'{n.qtd_vendas:>9} '
-                             f'{n.qtd_estoque_pos_vendas:>10} '
-                             f'{n.qtd_necessidade:>8} '
-                             f'{n.qtd_transf_arm_co:>11}\n')
+                         '                                   Vendas            Arm p/ CO\n' +
+                         ''.join(f'{n.cod_produto:<5} '
+                                 f'{n.qtd_produto_co:>7} '
+                                 f'{n.qtd_min_produto_co:>6} '
+                                 f'{n.qtd_vendas:>9} '
+                                 f'{n.qtd_estoque_pos_vendas:>10} '
+                                 f'{n.qtd_necessidade:>8} '
+                                 f'{n.qtd_transf_arm_co:>11}\n'
+                                 for n in necessidades))
 
 
 def _salvar_divergencias(divergencias: Iterable[_Divergencia]) -> None:
@@ -277,8 +277,8 @@ def _salvar_divergencias(divergencias: Iterable[_Divergencia]) -> None:
     :param divergencias: Lista de vendas de produtos não existentes ou com erro.
     """
     with _CAMINHO_ARQUIVO_DIVERGENCIAS.open('w') as arq_diver:
-        for divergencia in divergencias:
-            arq_diver.write(f'Linha {divergencia.num_linha_venda:02d} – {divergencia.msg_err}\n')
+        arq_diver.write(''.join(f'Linha {divergencia.num_linha_venda:02d} – {divergencia.msg_err}\n'
+                                for divergencia in divergencias))
 
 
 def _salvar_vendas_por_canal(vendas_por_canal: Iterable[_QtdVendasPorCanal]) -> None:
@@ -287,10 +287,10 @@ def _salvar_vendas_por_canal(vendas_por_canal: Iterable[_QtdVendasPorCanal]) ->
     :param vendas_por_canal: Relação de vendas por canal.
     """
     with _CAMINHO_ARQUIVO_VENDAS_POR_CANAL.open('w') as arq_totcanais:
-        arq_totcanais.write('Quantidades de Vendas por canal\n\n')
-        arq_totcanais.write(f'{'Canal':<21} {'QtVendas':>9}\n')
-        for vpc in vendas_por_canal:
-            arq_totcanais.write(f'{f'{vpc.canal.value} - {vpc.canal.descricao()}':<21} {vpc.qtd_vendas:>9}\n')
+        arq_totcanais.write('Quantidades de Vendas por canal\n\n'
+                            f'{'Canal':<21} {'QtVendas':>9}\n' +
+                            ''.join(f'{f'{vpc.canal.value} - {vpc.canal.descricao()}':<21} {vpc.qtd_vendas:>9}\n'
+                                    for vpc in vendas_por_canal))
 
 
 def _main() -> None:
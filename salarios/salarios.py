@@ -1,5 +1,5 @@
+from bisect import bisect_right
 from dataclasses import dataclass
-from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
 from sys import stderr
 from typing import Self, Final, TextIO, ClassVar
@@ -16,80 +16,76 @@ _MSG_ARQUIVO_TESTE_NAO_ENCONTRADO: Final[str] = 'Arquivo de teste não encontrad
 _CAMINHO_ENTRADA: Final[Path] = Path('salario.txt')
 _CAMINHO_SAIDA: Final[Path] = Path('calculos.txt')
 
-_REF_PRECISAO: Final[Decimal] = Decimal('.01')
+_CENTAVOS_POR_REAL: Final[int] = 100
+_ESCALA_ALIQUOTA: Final[int] = 1000
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, order=True)
-class _INSS:
+def _para_centavos(valor: str) -> int:
     """
-    Utilizado para representar dados sobre desconto do INSS.
+    Converte um valor monetário em texto para centavos.
+    :param valor: Valor monetário em reais, com até duas casas decimais.
+    :return: Valor monetário em centavos.
     """
-    __VALOR_TETO: ClassVar[Decimal] = Decimal(642.34)
+    return round(float(valor) * _CENTAVOS_POR_REAL)
 
-    __VALOR_SAL_MAX_N3: ClassVar[Decimal] = Decimal(5_839.45)
-    __VALOR_SAL_MIN_N3: ClassVar[Decimal] = Decimal(2_919.73)
-    __ALIQ_N3: ClassVar[Decimal] = Decimal(.11)
 
-    __VALOR_SAL_MIN_N2: ClassVar[Decimal] = Decimal(1_751.82)
-    __ALIQ_N2: ClassVar[Decimal] = Decimal(.09)
+def _arredondar_milesimos(valor: int) -> int:
+    """
+    Arredonda para centavos um valor expresso em milésimos de centavo, com meio centavo arredondado para cima.
+    :param valor: Valor em milésimos de centavo (ex.: centavos multiplicados por uma alíquota em milésimos).
+    :return: Valor arredondado, em centavos.
+    """
+    return (valor + _ESCALA_ALIQUOTA // 2) // _ESCALA_ALIQUOTA
 
-    __VALOR_SAL_MAX_N1: ClassVar[Decimal] = Decimal(1_751.81)
-    __ALIQ_N1: ClassVar[Decimal] = Decimal(.08)
 
-    aliquota: Decimal
-    valor: Decimal
-    base: Decimal
+@dataclass(frozen=True, kw_only=True, slots=True, order=True)
+class _INSS:
+    """
+    Utilizado para representar dados sobre desconto do INSS. Valores em centavos e alíquota em milésimos.
+    """
+    __VALOR_TETO: ClassVar[int] = 642_34
+
+    # Valor mínimo (inclusivo) de cada faixa a partir da segunda, e a alíquota de cada faixa; `0` indica o teto.
+    __VALORES_SAL_MIN_FAIXAS: ClassVar[tuple[int, ...]] = (1_751_82, 2_919_73, 5_839_45 + 1)
+    __ALIQS_FAIXAS: ClassVar[tuple[int, ...]] = (80, 90, 110, 0)
+
+    aliquota: int
+    valor: int
+    base: int
 
     @classmethod
-    def from_valor_base(cls, valor_salario_bruto: Decimal) -> Self:
+    def from_valor_base(cls, valor_salario_bruto: int) -> Self:
         """
         Calcula e retorna dados sobre o INSS a partir do salário bruto.
-        :param valor_salario_bruto: Valor do salário bruto para base do cálculo
+        :param valor_salario_bruto: Valor do salário bruto em centavos para base do cálculo
         :return: Dados sobre o desconto do INSS, com dados calculados a partir do salário bruto.
         """
-        aliquota = Decimal(0)
-
-        match valor_salario_bruto.quantize(_REF_PRECISAO, rounding=ROUND_HALF_UP):
-            case num if num > cls.__VALOR_SAL_MAX_N3:
-                pass
-            case num if num >= cls.__VALOR_SAL_MIN_N3:
-                aliquota = cls.__ALIQ_N3
-            case num if num >= cls.__VALOR_SAL_MIN_N2:
-                aliquota = cls.__ALIQ_N2
-            case num if num <= cls.__VALOR_SAL_MAX_N1:
-                aliquota = cls.__ALIQ_N1
+        aliquota = cls.__ALIQS_FAIXAS[bisect_right(cls.__VALORES_SAL_MIN_FAIXAS, valor_salario_bruto)]
 
         return _INSS(aliquota=aliquota,
-                     valor=(valor_salario_bruto * aliquota) if aliquota else cls.__VALOR_TETO,
+                     valor=(_arredondar_milesimos(valor_salario_bruto * aliquota)
+                            if aliquota else cls.__VALOR_TETO),
                      base=valor_salario_bruto)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True, order=True)
 class _IR:
     """
-    Utilizado para representar dados sobre desconto do Imposto de Renda.
+    Utilizado para representar dados sobre desconto do Imposto de Renda. Valores em centavos e alíquota em milésimos.
     """
-    __VALOR_BASE_MIN_N4_NAO_INCLUSIVO: ClassVar[Decimal] = Decimal(4_664.68)
-    __ALIQ_N4: ClassVar[Decimal] = Decimal(.275)
-    __VALOR_DEDUCAO_N4: ClassVar[Decimal] = Decimal(869.36)
-
-    __VALOR_BASE_MIN_N3: ClassVar[Decimal] = Decimal(3_751.06)
-    __ALIQ_N3: ClassVar[Decimal] = Decimal(.225)
-    __VALOR_DEDUCAO_N3: ClassVar[Decimal] = Decimal(636.13)
-
-    __VALOR_BASE_MIN_N2: ClassVar[Decimal] = Decimal(2_826.66)
-    __ALIQ_N2: ClassVar[Decimal] = Decimal(.15)
-    __VALOR_DEDUCAO_N2: ClassVar[Decimal] = Decimal(354.80)
-
-    __VALOR_BASE_MIN_N1: ClassVar[Decimal] = Decimal(1_903.99)
-    __ALIQ_N1: ClassVar[Decimal] = Decimal(.075)
-    __VALOR_DEDUCAO_N1: ClassVar[Decimal] = Decimal(142.80)
+    # Valor mínimo (inclusivo) de cada faixa a partir da segunda, e a alíquota e dedução de cada faixa.
+    __VALORES_BASE_MIN_FAIXAS: ClassVar[tuple[int, ...]] = (1_903_99, 2_826_66, 3_751_06, 4_664_68 + 1)
+    __ALIQS_DEDUCOES_FAIXAS: ClassVar[tuple[tuple[int, int], ...]] = ((0, 0),
+                                                                      (75, 142_80),
+                                                                      (150, 354_80),
+                                                                      (225, 636_13),
+                                                                      (275, 869_36))
 
-    __VALOR_MINIMO_P_TAXACAO: ClassVar[Decimal] = Decimal(10)
+    __VALOR_MINIMO_P_TAXACAO: ClassVar[int] = 10_00
 
-    aliquota: Decimal
-    valor: Decimal
-    base: Decimal
+    aliquota: int
+    valor: int
+    base: int
 
     @classmethod
     def from_inss(cls, inss: _INSS) -> Self:
@@ -98,40 +94,29 @@ class _IR:
         :param inss: Dados sobre o INSS para calcular o Imposto de Renda.
         :return: Dados sobre o Imposto de Renda a partir do INSS.
         """
-        aliquota = Decimal(0)
-        deducao = Decimal(0)
-
-        match base := (inss.base - inss.valor).quantize(_REF_PRECISAO, rounding=ROUND_HALF_UP):
-            case num if num > cls.__VALOR_BASE_MIN_N4_NAO_INCLUSIVO:
-                aliquota = cls.__ALIQ_N4
-                deducao = cls.__VALOR_DEDUCAO_N4
-            case num if num >= cls.__VALOR_BASE_MIN_N3:
-                aliquota = cls.__ALIQ_N3
-                deducao = cls.__VALOR_DEDUCAO_N3
-            case num if num >= cls.__VALOR_BASE_MIN_N2:
-                aliquota = cls.__ALIQ_N2
-                deducao = cls.__VALOR_DEDUCAO_N2
-            case num if num >= cls.__VALOR_BASE_MIN_N1:
-                aliquota = cls.__ALIQ_N1
-                deducao = cls.__VALOR_DEDUCAO_N1
+        base = inss.base - inss.valor
+        aliquota, deducao = cls.__ALIQS_DEDUCOES_FAIXAS[bisect_right(cls.__VALORES_BASE_MIN_FAIXAS, base)]
 
+        # O valor mínimo para taxação é comparado antes do arredondamento, em milésimos de centavo.
+        valor = base * aliquota - deducao * _ESCALA_ALIQUOTA
         return _IR(aliquota=aliquota,
-                   valor=(valor := base * aliquota - deducao) * int(valor >= cls.__VALOR_MINIMO_P_TAXACAO),
+                   valor=(_arredondar_milesimos(valor) *
+                          int(valor >= cls.__VALOR_MINIMO_P_TAXACAO * _ESCALA_ALIQUOTA)),
                    base=base)
 
 
 @dataclass(frozen=True, kw_only=True, slots=True, order=True)
 class _Salario:
     """
-    Utilizado para representar dados de salário, incluindo desconto de INSS e IR.
+    Utilizado para representar dados de salário, incluindo desconto de INSS e IR. Valores em centavos.
     """
-    valor_bruto: Decimal
+    valor_bruto: int
     inss: _INSS
     ir: _IR
-    valor_liquido: Decimal
+    valor_liquido: int
 
     @classmethod
-    def from_valor_bruto(cls, valor_salario_bruto: Decimal) -> Self:
+    def from_valor_bruto(cls, valor_salario_bruto: int) -> Self:
         return _Salario(valor_bruto=valor_salario_bruto,
                         inss=(inss := _INSS.from_valor_base(valor_salario_bruto)),
                         ir=(ir := _IR.from_inss(inss)),
@@ -144,7 +129,7 @@ def _exec_teste_de_caso(arquivo_entrada: TextIO, arquivo_saida: TextIO) -> None:
     :param arquivo_entrada: Arquivo de entrada com valores de salário bruto para cálculo de descontos.
     :param arquivo_saida: Arquivo de saída em que os resultados dos cálculos deverão ser escritos.
     """
-    salarios = (_Salario.from_valor_bruto(Decimal(salario)) for salario in arquivo_entrada.readlines())
+    valores_brutos = sorted(_para_centavos(salario) for salario in arquivo_entrada)
     arquivo_saida.write((f'{'Bruto':>9} '
                          f'{'AliqINSS':>9} '
                          f'{'Val.INSS':>9} '
@@ -152,14 +137,14 @@ def _exec_teste_de_caso(arquivo_entrada: TextIO, arquivo_saida: TextIO) -> None:
                          f'{'AliqIR':>9} '
                          f'{'Val.IR':>9} '
                          f'{'Liquido':>9}\n'))
-    for salario in sorted(salarios, key=lambda s: s.valor_bruto):
-        arquivo_saida.write((f'{salario.valor_bruto:>9.2f} '
-                             f'{salario.inss.aliquota * 100:>9.1f} '
-                             f'{salario.inss.valor:>9.2f} '
-                             f'{salario.ir.base:>9.2f} '
-                             f'{salario.ir.aliquota * 100:>9.2f} '
-                             f'{salario.ir.valor:>9.2f} '
-                             f'{salario.valor_liquido:>9.2f}\n'))
+    for salario in map(_Salario.from_valor_bruto, valores_brutos):
+        arquivo_saida.write((f'{salario.valor_bruto / _CENTAVOS_POR_REAL:>9.2f} '
+                             f'{salario.inss.aliquota * 100 / _ESCALA_ALIQUOTA:>9.1f} '
+                             f'{salario.inss.valor / _CENTAVOS_POR_REAL:>9.2f} '
+                             f'{salario.ir.base / _CENTAVOS_POR_REAL:>9.2f} '
+                             f'{salario.ir.aliquota * 100 / _ESCALA_ALIQUOTA:>9.2f} '
+                             f'{salario.ir.valor / _CENTAVOS_POR_REAL:>9.2f} '
+                             f'{salario.valor_liquido / _CENTAVOS_POR_REAL:>9.2f}\n'))
 
 
 def _main() -> None:
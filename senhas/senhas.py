@@ -1,9 +1,9 @@
 from enum import IntFlag, auto, StrEnum
-from itertools import islice
 from pathlib import Path
-from random import randint, choice, shuffle
+from random import choices, shuffle
+from string import digits, ascii_uppercase, ascii_lowercase
 from sys import stderr
-from typing import Iterable, Final
+from typing import Final
 
 _MSG_INICIO: Final[str] = '''Gerador de Senhas
 Abner Eduardo Ramos Ferreira
@@ -27,19 +27,24 @@ class _ComponentesSenha(IntFlag):
     Minusculas = auto()
     Especiais = auto()
 
-    def gerar(self) -> Iterable[str]:
+    def gerar(self, tamanho: int) -> list[str]:
         """
-        Gera componentes individuais de uma senha.
-        :return: Componentes básicos da senha.
+        Gera os caracteres de uma senha, distribuindo as posições igualmente entre os componentes.
+        :param tamanho: Quantidade de caracteres a serem gerados.
+        :return: Caracteres da senha, agrupados por componente.
         """
-        if self & _ComponentesSenha.Algarismos:
-            yield chr(randint(ord('0'), ord('9')))
-        if self & _ComponentesSenha.Maiusculas:
-            yield chr(randint(ord('A'), ord('Z')))
-        if self & _ComponentesSenha.Minusculas:
-            yield chr(randint(ord('a'), ord('z')))
-        if self & _ComponentesSenha.Especiais:
-            yield choice('-_:@#$&?')
+        componentes = tuple(self)
+        return [char
+                for i, componente in enumerate(componentes)
+                for char in choices(_ALFABETOS[componente], k=len(range(i, tamanho, len(componentes))))]
+
+
+_ALFABETOS: Final[dict[_ComponentesSenha, str]] = {
+    _ComponentesSenha.Algarismos: digits,
+    _ComponentesSenha.Maiusculas: ascii_uppercase,
+    _ComponentesSenha.Minusculas: ascii_lowercase,
+    _ComponentesSenha.Especiais: '-_:@#$&?',
+}
 
 
 class _TipoSenha(StrEnum):
@@ -78,7 +83,7 @@ class _TipoSenha(StrEnum):
         :param tamanho: Tamanho da senha gerada.
         :return: Uma nova senha pseudoaleatória com o tipo e tamanho informados.
         """
-        senha = list(islice((char for _ in range(tamanho) for char in self.__componentes().gerar()), tamanho))
+        senha = self.__componentes().gerar(tamanho)
         shuffle(senha)
         return ''.join(senha)
 
@@ -97,7 +102,7 @@ def _main() -> None:
     tipo_senha = _TipoSenha(selecao_senha)
     tamanho_senha = abs(int(input('Insira tamanho da senha: ')))
     with _CAMINHO_ARQUIVO_ENTRADA.open() as arq_entrada, _CAMINHO_ARQUIVO_SAIDA.open('w') as arq_saida:
-        for matricula in arq_entrada.readlines():
+        for matricula in arq_entrada:
             arq_saida.write(f'{matricula.strip()};{tipo_senha.gerar_senha(tamanho_senha)}\n')
 
 